@@ -86,15 +86,20 @@ def get_macrotile_map():
                 # Use gdal warp with cubicspline when maxzoom is 12
                 maxzoom = max(maxzoom, utils.macrotile_z)
 
+                source_item = {
+                    'filename': filename,
+                    'maxzoom': maxzoom,
+                }
                 for tile in tiles:
-                    if (tile.x, tile.y) not in macrotile_map:
-                        macrotile_map[(tile.x, tile.y)] = {'sources': {}}
-                    if source not in macrotile_map[(tile.x, tile.y)]['sources']:
-                        macrotile_map[(tile.x, tile.y)]['sources'][source] = []
-                    macrotile_map[(tile.x, tile.y)]['sources'][source].append({
-                        'filename': filename,
-                        'maxzoom': maxzoom,
-                    })
+                    macrotile = macrotile_map.get((tile.x, tile.y))
+                    if macrotile is None:
+                        macrotile = {'sources': {}}
+                        macrotile_map[(tile.x, tile.y)] = macrotile
+                    source_items = macrotile['sources'].get(source)
+                    if source_items is None:
+                        source_items = []
+                        macrotile['sources'][source] = source_items
+                    source_items.append(source_item)
                 line = f.readline().strip()
 
     return macrotile_map
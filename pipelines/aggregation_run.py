@@ -1,6 +1,5 @@
 from glob import glob
 import shutil
-import os
 from multiprocessing import Pool
 
 import aggregation_reproject
@@ -31,7 +30,8 @@ def main():
         last_aggregation_id = aggregation_ids[-2]
         dirty_filepaths = [f'aggregation-store/{aggregation_id}/{filename}' for filename in utils.get_dirty_aggregation_filenames(aggregation_id, last_aggregation_id)]
     
-    dirty_filepaths = [filepath for filepath in dirty_filepaths if not os.path.isfile(filepath.replace('-aggregation.csv', '-aggregation.done'))]
+    done_filepaths = set(glob(f'aggregation-store/{aggregation_id}/*-aggregation.done'))
+    dirty_filepaths = [filepath for filepath in dirty_filepaths if filepath.replace('-aggregation.csv', '-aggregation.done') not in done_filepaths]
     if len(dirty_filepaths) == 0:
         print('nothing to do.')
     else:
@@ -32,10 +32,12 @@ def main():
                 'access_year': metadata['access_year'],
             }
         tar_filepath = f'tar-store/{source}.tar'
-        if not os.path.isfile(tar_filepath):
-            print('Error: tar file missing for source {source}')
+        try:
+            tar_stat = os.stat(tar_filepath)
+        except FileNotFoundError:
+            print(f'Error: tar file missing for source {source}')
             return
-        item['tarball_size'] = os.path.getsize(tar_filepath)
+        item['tarball_size'] = tar_stat.st_size
         with open(f'{tar_filepath}.md5') as f:
             line = f.readline()
             item['tarball_md5sum'] = line.strip().split(' ')[0]
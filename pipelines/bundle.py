@@ -1,7 +1,8 @@
 from glob import glob
-import math
 import time
 
+import numpy as np
+
 import mercantile
 from pmtiles.tile import zxy_to_tileid, TileType, Compression
 from pmtiles.reader import Reader, MmapSource, all_tiles
@@ -68,13 +69,9 @@ def create_archive(filepaths, out_filepath):
     with open(out_filepath, 'wb') as f1:
         hash_writer = utils.HashWriter(f1)
         writer = Writer(hash_writer)
-        min_z = math.inf
-        max_z = 0
-        min_lon = math.inf
-        min_lat = math.inf
-        max_lon = -math.inf
-        max_lat = -math.inf
 
+        child_zooms = []
+        parent_bounds = []
         tile_ids_and_filepaths = []
 
         j = 0
@@ -90,25 +87,26 @@ def create_archive(filepaths, out_filepath):
             for tile in tiles:
                 tile_id = zxy_to_tileid(tile.z, tile.x, tile.y)
                 tile_ids_and_filepaths.append((tile_id, filepath))
-        
-            max_z = max(max_z, child_z)
-            min_z = min(min_z, child_z)
-            west, south, east, north = mercantile.bounds(x, y, z)
-            min_lon = min(min_lon, west)
-            min_lat = min(min_lat, south)
-            max_lon = max(max_lon, east)
-            max_lat = max(max_lat, north)
+
+            child_zooms.append(child_z)
+            parent_bounds.append(mercantile.bounds(x, y, z))
             j += 1
             if j % 1000 == 0:
                 print(f'prepared {j:_} / {len(filepaths):_} filepaths...')
 
+        min_z = min(child_zooms)
+        max_z = max(child_zooms)
+        parent_bounds = np.array(parent_bounds, dtype=np.float64)
+        min_lon, min_lat = parent_bounds[:, :2].min(axis=0)
+        max_lon, max_lat = parent_bounds[:, 2:].max(axis=0)
+
         tile_ids_and_filepaths = sorted(tile_ids_and_filepaths)
         
         last_filepath = None
         tile_id_to_bytes = None
 
         j = 0
-        start = time.time()
+        start = time.perf_counter()
         for tile_id, filepath in tile_ids_and_filepaths:
             if filepath != last_filepath:
                 last_filepath = filepath
@@ -117,7 +115,7 @@ def create_archive(filepaths, out_filepath):
 
             j += 1
             if j % 10_000 == 0:
-                tic = time.time()
+                tic = time.perf_counter()
                 time_so_far = tic - start
                 expected_duration = time_so_far * len(tile_ids_and_filepaths) / j
                 finishes_in = expected_duration - time_so_far
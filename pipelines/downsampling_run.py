@@ -3,7 +3,6 @@ import io
 from multiprocessing import Pool
 import shutil
 from datetime import datetime
-import os
 
 import numpy as np
 from PIL import Image
@@ -66,10 +65,13 @@ def get_tile_to_pmtiles_filename(pmtiles_filenames):
     return tile_to_pmtiles_filename
 
 def main(filepaths):
+    aggregation_id = filepaths[0].split('/')[1]
+    done_filepaths = set(glob(f'aggregation-store/{aggregation_id}/*-downsampling.done'))
+
     for j, filepath in enumerate(filepaths):
         _, aggregation_id, filename = filepath.split('/')
         print(f'downsampling {filename}. {datetime.now()}. {j + 1} / {len(filepaths)}.')
-        if os.path.isfile(filepath.replace("-downsampling.csv", "-downsampling.done")):
+        if filepath.replace("-downsampling.csv", "-downsampling.done") in done_filepaths:
             print('already done...')
             continue
         parts = filename.split('-')
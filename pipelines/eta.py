@@ -1,7 +1,6 @@
 from glob import glob
 from datetime import datetime
 import os
-import math
 
 
 import utils
@@ -40,9 +39,7 @@ filepaths = glob(f'aggregation-store/{utils.get_aggregation_ids()[-1]}/*-{kind}.
 if len(filepaths) == 0:
     print('nothing done yet')
     exit()
-first_timestamp = math.inf
-for filepath in filepaths:
-    first_timestamp = min(first_timestamp, os.path.getmtime(filepath))
+first_timestamp = min(os.path.getmtime(filepath) for filepath in filepaths)
 start_time = datetime.fromtimestamp(first_timestamp)
 print('start time:', start_time)
 print('eta:', eta(children_done / children_total, start_time))
@@ -115,13 +115,13 @@ def get_filenames(mirror_base_url):
     mapterhorn_r = requests.get('https://download.mapterhorn.com/download_urls.json')
     if mapterhorn_r.status_code != 200:
         raise Exception('Failed to load download_urls.json from mapterhorn.com')
-    mapterhorn_data = json.loads(mapterhorn_r.text)
+    mapterhorn_data = mapterhorn_r.json()
     mapterhorn_name_to_md5sum = {item['name']: item['md5sum'] for item in mapterhorn_data['items']}
 
     mirror_r = requests.get(f'{mirror_base_url}download_urls.json')
     mirror_name_to_md5sum = {}
     if mirror_r.status_code == 200:
-        mirror_data = json.loads(mirror_r.text)
+        mirror_data = mirror_r.json()
         mirror_name_to_md5sum = {item['name']: item['md5sum'] for item in mirror_data['items']}
     
     for name in mapterhorn_name_to_md5sum:
@@ -8,14 +8,14 @@ import utils
 def get_size_by_filename():
     size_by_filename = {}
     r = requests.get('https://download.mapterhorn.com/download_urls.json')
-    data = json.loads(r.text)
+    data = r.json()
     for item in data['items']:
         size_by_filename[item['name']] = item['size']
     return size_by_filename
 
 def get_mirrors():
     r = requests.get('https://raw.githubusercontent.com/mapterhorn/mapterhorn/refs/heads/main/distribution/mirrors.json')
-    return json.loads(r.text)
+    return r.json()
 
 def main():   
     last_update = int(time.time())
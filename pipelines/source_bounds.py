@@ -1,26 +1,16 @@
 from glob import glob
 import sys
 import math
+from multiprocessing import Pool
 
 import rasterio
 from rasterio.warp import transform_bounds
 
 import utils
 
-def main():
-    source = None
-    if len(sys.argv) > 1:
-        source = sys.argv[1]
-        print(f'creating bounds for {source}...')
-    else:
-        print('source argument missing...')
-        exit()
-    
-    filepaths = sorted(glob(f'source-store/{source}/*.tif'))
-
-    bounds_file_lines = ['filename,left,bottom,right,top,width,height\n']
-
-    for j, filepath in enumerate(filepaths):
+def get_bounds_line(filepath):
+    # only the embedded geotiff header is needed, don't probe for sidecar files on every open
+    with rasterio.env.Env(GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR'):
         with rasterio.open(filepath) as src:
             if src.crs is None:
                 raise ValueError(f'crs not defined on {filepath}')
@@ -36,7 +26,24 @@ def main():
                 if not math.isfinite(num):
                     raise ValueError(f'Number in bounds is not finite. src.bounds={src.bounds} src.crs={src.crs} bounds={(left, bottom, right, top)}')
             filename = filepath.split('/')[-1]
-            bounds_file_lines.append(f'{filename},{left},{bottom},{right},{top},{src.width},{src.height}\n')
+            return f'{filename},{left},{bottom},{right},{top},{src.width},{src.height}\n'
+
+def main():
+    source = None
+    if len(sys.argv) > 1:
+        source = sys.argv[1]
+        print(f'creating bounds for {source}...')
+    else:
+        print('source argument missing...')
+        exit()
+    
+    filepaths = sorted(glob(f'source-store/{source}/*.tif'))
+
+    bounds_file_lines = ['filename,left,bottom,right,top,width,height\n']
+
+    with Pool() as pool:
+        for j, line in enumerate(pool.imap(get_bounds_line, filepaths, chunksize=16)):
+            bounds_file_lines.append(line)
             if j % 100 == 0:
                 print(f'{j} / {len(filepaths)}')
 
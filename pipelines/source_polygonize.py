@@ -14,11 +14,13 @@ def polygonize_tif(source, filename):
     os.remove(mask_filepath)
 
 def get_filenames(source):
-    lines = None
-    with open(f'source-store/{source}/bounds.csv') as f:
-        lines = f.readlines()
-    lines = [l.strip() for l in lines[1:]]
-    filenames = [line.split(',')[0] for line in lines]
+    filenames = []
+    with open(f'source-store/{source}/bounds.csv', 'rb') as f:
+        f.readline() # skip header
+        for line in f:
+            line = line.strip()
+            if line != b'':
+                filenames.append(line.split(b',', 1)[0].decode())
     return filenames
 
 def polygonize_source(source, processes):
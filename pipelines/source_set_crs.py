@@ -1,5 +1,6 @@
 from glob import glob
 import sys
+from collections import Counter
 
 import utils
 
@@ -10,7 +11,7 @@ SILENT = False
 
 def set_crs(filepath, crs):
     utils.run_command(f'mv "{filepath}" "{filepath}.bak"', silent=SILENT)
-    utils.run_command(f'gdal_translate -a_srs {crs} -of COG -co BLOCKSIZE=512 -co OVERVIEWS=NONE -co SPARSE_OK=YES -co BIGTIFF=YES -co COMPRESS=LERC -co MAX_Z_ERROR=0.001 "{filepath}.bak" "{filepath}"', silent=SILENT)
+    utils.run_command(f'gdal_translate -a_srs {crs} {utils.source_cog_options} "{filepath}.bak" "{filepath}"', silent=SILENT)
     utils.run_command(f'rm "{filepath}.bak"', silent=SILENT)
 
 def main():
@@ -31,15 +32,16 @@ def main():
     filepaths = sorted(glob(f'source-store/{source}/*.tif'))
 
     if crs is None:
-        crses = set({})
-        for j, filepath in enumerate(filepaths):
-            if j % 100 == 0:
-                print(f'{j:_} / {len(filepaths):_}')
-            with rasterio.open(filepath) as src:
-                crses.add(src.crs)
+        crses = Counter()
+        with rasterio.env.Env(GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR'):
+            for j, filepath in enumerate(filepaths):
+                if j % 100 == 0:
+                    print(f'{j:_} / {len(filepaths):_}')
+                with rasterio.open(filepath) as src:
+                    crses[src.crs] += 1
         print(f'\nfound {len(crses)} crs(es):')
-        for crs in crses:
-            print(f'  -> {crs}')
+        for crs, count in crses.most_common():
+            print(f'  -> {crs} ({count:_} files)')
         exit()
 
     argument_tuples = []
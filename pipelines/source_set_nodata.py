@@ -1,5 +1,6 @@
 from glob import glob
 import sys
+from collections import Counter
 from multiprocessing import Pool
 
 import rasterio
@@ -34,17 +35,18 @@ def main():
     filepaths = sorted(glob(f'source-store/{source}/*'))
 
     argument_tuples = []
-    nodata_values = set({})
-    for filepath in filepaths:
-        if not filepath.endswith('.tif'):
-            continue
-        with rasterio.open(filepath) as src:
-            if src.nodata is None or force:
-                argument_tuples.append((filepath, nodata))
-            else:
-                nodata_values.add(src.nodata)
+    nodata_values = Counter()
+    with rasterio.env.Env(GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR'):
+        for filepath in filepaths:
+            if not filepath.endswith('.tif'):
+                continue
+            with rasterio.open(filepath) as src:
+                if src.nodata is None or force:
+                    argument_tuples.append((filepath, nodata))
+                else:
+                    nodata_values[src.nodata] += 1
 
-    print(f'Found these nodata values: {nodata_values}')
+    print(f'Found these nodata values: {dict(nodata_values)}')
     print(f'Will set nodata on {len(argument_tuples)} files. Nothing to do for the remaining {len(filepaths) - len(argument_tuples)} files...')
     with Pool() as pool:
         pool.starmap(set_nodata, argument_tuples)
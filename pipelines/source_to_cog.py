@@ -1,39 +1,21 @@
-from glob import glob
+import os
 import sys
 from multiprocessing import Pool
+from pathlib import Path
+
 import utils
 
 SILENT = False
 
 def to_cog(filepath):
-    filepath_in = None
-    filepath_out = None
-    if filepath.endswith('.tif'):
-        utils.run_command(f'mv {filepath} {filepath}.bak', silent=SILENT)
-        filepath_in = f'{filepath}.bak'
-        filepath_out = filepath
-    elif filepath.endswith('.TIF'):
+    path = Path(filepath)
+    filepath_in = filepath
+    filepath_out = str(path.with_suffix('.tif'))
+    if path.suffix in ('.tif', '.TIF', '.tiff'):
         utils.run_command(f'mv {filepath} {filepath}.bak', silent=SILENT)
         filepath_in = f'{filepath}.bak'
-        filepath_out = filepath.replace('.TIF', '.tif')
-    elif filepath.endswith('.tiff'):
-        utils.run_command(f'mv {filepath} {filepath}.bak', silent=SILENT)
-        filepath_in = f'{filepath}.bak'
-        filepath_out = filepath.replace('.tiff', '.tif')
-    elif filepath.endswith('.xyz'):
-        filepath_in = filepath
-        filepath_out = filepath.replace('.xyz', '.tif')
-    elif filepath.endswith('.asc'):
-        filepath_in = filepath
-        filepath_out = filepath.replace('.asc', '.tif')
-    elif filepath.endswith('.ASC'):
-        filepath_in = filepath
-        filepath_out = filepath.replace('.ASC', '.tif')
-    elif filepath.endswith('.txt'):
-        filepath_in = filepath
-        filepath_out = filepath.replace('.txt', '.tif')
     
-    utils.run_command(f'GDAL_CACHEMAX=512 gdal_translate -of COG -co BLOCKSIZE=512 -co OVERVIEWS=NONE -co SPARSE_OK=YES -co BIGTIFF=YES -co COMPRESS=LERC -co MAX_Z_ERROR=0.001 "{filepath_in}" "{filepath_out}"', silent=SILENT)
+    utils.run_command(f'GDAL_CACHEMAX=512 gdal_translate {utils.source_cog_options} "{filepath_in}" "{filepath_out}"', silent=SILENT)
     utils.run_command(f'rm "{filepath_in}"', silent=SILENT)
 
 def main():
@@ -45,16 +27,9 @@ def main():
         print('source argument missing')
         exit()
     
-    filepaths = []
-    filepaths += glob(f'source-store/{source}/*.tif')
-    filepaths += glob(f'source-store/{source}/*.TIF')
-    filepaths += glob(f'source-store/{source}/*.tiff')
-    filepaths += glob(f'source-store/{source}/*.xyz')
-    filepaths += glob(f'source-store/{source}/*.asc')
-    filepaths += glob(f'source-store/{source}/*.ASC')
-    filepaths += glob(f'source-store/{source}/*.txt')
-
-    filepaths = [(filepath,) for filepath in sorted(filepaths)]
+    suffixes = ('.tif', '.TIF', '.tiff', '.xyz', '.asc', '.ASC', '.txt')
+    filenames = sorted(filename for filename in os.listdir(f'source-store/{source}') if filename.endswith(suffixes) and not filename.startswith('.'))
+    filepaths = [(f'source-store/{source}/{filename}',) for filename in filenames]
 
     print(f'num files: {len(filepaths)}')
     with Pool() as pool:
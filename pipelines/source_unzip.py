@@ -4,6 +4,7 @@ import zipfile
 import shutil
 import os
 from multiprocessing import Pool
+from pathlib import Path
 
 import utils
 
@@ -29,27 +30,20 @@ def un7z(filepath, source):
 def translate_image(filepath_in, filepath_out, j, total):
     if j % 1000 == 0:
         print(f'{j} / {total}')
-    utils.run_command(f'gdal_translate -of COG -co BLOCKSIZE=512 -co OVERVIEWS=NONE -co SPARSE_OK=YES -co BIGTIFF=YES -co COMPRESS=LERC -co MAX_Z_ERROR=0.001 "{filepath_in}" "{filepath_out}"', silent=True)
+    utils.run_command(f'gdal_translate {utils.source_cog_options} "{filepath_in}" "{filepath_out}"', silent=True)
 
-def translate_images(filepath, source, suffix):
+def translate_images(pool, filepath, source, suffix):
     print(f'translate .{suffix} images...')
     # suffix = 'asc' or 'tif' u.s.w. (without dot)
     image_filepaths = glob(f'{filepath}-tmp/**/*.{suffix}', recursive=True)
     
     argument_tuples = []
-    j = 0
-    for image_filepath in image_filepaths:
-        image_filename = image_filepath.split('/')[-1]
+    for j, image_filepath in enumerate(image_filepaths):
+        filename_out = Path(image_filepath).with_suffix('.tif').name
+        filepath_out = f'source-store/{source}/{filename_out}'
+        argument_tuples.append((image_filepath, filepath_out, j, len(image_filepaths)))
 
-        filepath_in = image_filepath
-        filepath_out = f'source-store/{source}/{image_filename}'
-        suffix_length = len(suffix)
-        filepath_out = filepath_out[:-suffix_length] + 'tif'
-        argument_tuples.append((filepath_in, filepath_out, j, len(image_filepaths)))
-        j += 1
-
-    with Pool() as pool:
-        pool.starmap(translate_image, argument_tuples, chunksize=1)
+    pool.starmap(translate_image, argument_tuples, chunksize=1)
 
 def is_7z_head_file(filepath):
     return filepath.endswith('.7z') or filepath.endswith('.7z.001')
@@ -66,22 +60,19 @@ def main():
     
     filepaths = sorted(glob(f'source-store/{source}/*'))
 
-    for filepath in filepaths:
-        if zipfile.is_zipfile(filepath):
-            unzip(filepath, source)
-        elif is_7z_head_file(filepath):
-            un7z(filepath, source)
+    with Pool() as pool:
+        for filepath in filepaths:
+            if zipfile.is_zipfile(filepath):
+                unzip(filepath, source)
+            elif is_7z_head_file(filepath):
+                un7z(filepath, source)
 
-        translate_images(filepath, source, 'tif')
-        translate_images(filepath, source, 'TIF')
-        translate_images(filepath, source, 'asc')
-        translate_images(filepath, source, 'ASC')
-        translate_images(filepath, source, 'xyz')
-        translate_images(filepath, source, 'grd')
-        
-        tmpdir = f'{filepath}-tmp'
-        if os.path.isdir(tmpdir):
-            shutil.rmtree(tmpdir)
+            for suffix in ['tif', 'TIF', 'asc', 'ASC', 'xyz', 'grd']:
+                translate_images(pool, filepath, source, suffix)
+            
+            tmpdir = f'{filepath}-tmp'
+            if os.path.isdir(tmpdir):
+                shutil.rmtree(tmpdir)
 
 if __name__ == '__main__':
     main()
@@ -26,7 +26,7 @@ def main():
         filename_out = filename.replace('.zip', '.tif')
         filepath_out = f'source-store/{source}/{filename_out}'
         
-        utils.run_command(f'gdal_translate -of COG -co BLOCKSIZE=512 -co OVERVIEWS=NONE -co SPARSE_OK=YES -co BIGTIFF=YES -co COMPRESS=LERC -co MAX_Z_ERROR=0.001 "{filepath_in}" "{filepath_out}"', silent=SILENT)
+        utils.run_command(f'gdal_translate {utils.source_cog_options} "{filepath_in}" "{filepath_out}"', silent=SILENT)
 
         
         tmpdir = f'{filepath}-tmp'
@@ -1,37 +1,77 @@
 import json
-
+import mimetypes
+from multiprocessing.pool import ThreadPool
+from functools import lru_cache
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import requests
 
-import utils
-
 SILENT = False
-
-def upload_local_resource_to_s3(directory, filename, bucket, key, region, endpoint):
+PROCESSES = 8
+
+TRANSFER_CONFIG = TransferConfig(multipart_chunksize=16 * 1024 * 1024, max_concurrency=8)
+
+# shared so both manifest requests reuse one connection to download.mapterhorn.com
+SESSION = requests.Session()
+
+@lru_cache(maxsize=None)
+def get_s3_client(region, endpoint):
+    # every upload thread runs up to max_concurrency part requests on this one client
+    config = Config(max_pool_connections=PROCESSES * TRANSFER_CONFIG.max_concurrency)
+    return boto3.session.Session().client('s3', region_name=region, endpoint_url=endpoint, config=config)
+
+def is_uploaded(bucket, key, md5sum, region, endpoint):
+    try:
+        head = get_s3_client(region, endpoint).head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+            return False
+        raise
+    if head['Metadata'].get('md5sum') == md5sum:
+        return True
+    # the etag is only the plain md5 for objects that were not uploaded in multiple parts
+    return head['ETag'].strip('"') == md5sum
+
+def upload_local_resource_to_s3(directory, filename, bucket, key, region, endpoint, md5sum=None):
     '''
     Requires the following env variables:
     $ export AWS_ACCESS_KEY_ID=MY_KEY
     $ export AWS_SECRET_ACCESS_KEY=MY_SECRET
+
+    If md5sum is given, the upload is skipped when the object already has that checksum
+    and the checksum is stored as object metadata otherwise.
     '''
-    command = f'aws s3 cp {directory}/{filename} s3://{bucket}/{key} --region {region} --endpoint "{endpoint}"'
-    _, err = utils.run_command(command, silent=SILENT)
-    if err != '':
-        print('err:', err)
-        raise Exception(err)
-
-def handle_pmtiles(bucket, region, endpoint):
-    r = requests.get('https://download.mapterhorn.com/download_urls.json')
+    extra_args = {}
+    if md5sum is not None:
+        if is_uploaded(bucket, key, md5sum, region, endpoint):
+            print(f'{key} is already uploaded. Skipping...')
+            return
+        extra_args['Metadata'] = {'md5sum': md5sum}
+    # the aws cli guessed the content type from the extension, upload_file does not
+    content_type = mimetypes.guess_type(filename)[0]
+    if content_type is not None:
+        extra_args['ContentType'] = content_type
+    if not SILENT:
+        print(f'uploading {directory}/{filename} to s3://{bucket}/{key}')
+    get_s3_client(region, endpoint).upload_file(f'{directory}/{filename}', bucket, key, ExtraArgs=extra_args, Config=TRANSFER_CONFIG)
+
+def get_online_json(filename):
+    r = SESSION.get(f'https://download.mapterhorn.com/{filename}')
     if r.status_code != 200:
-        raise Exception('Error: could not get online download_urls.json')
-    
-    online_download_urls = json.loads(r.text)
-    online_items = {}
-    for item in online_download_urls['items']:
-        online_items[item['name']] = item
+        raise Exception(f'Error: could not get online {filename}')
+    return r.json()
+
+def get_pmtiles_argument_tuples(online_download_urls, bucket, region, endpoint):
+    online_items = {item['name']: item for item in online_download_urls['items']}
     
     download_urls = None
     with open('bundle-store/download_urls.json') as f:
         download_urls = json.load(f)
 
+    argument_tuples = []
     for item in download_urls['items']:
         print(item['name'])
         if item['name'] in online_items and online_items[item['name']]['md5sum'] == item['md5sum']:
@@ -41,23 +81,17 @@ def handle_pmtiles(bucket, region, endpoint):
         filename = item['name']
         directory = f'bundle-store/{filename.replace(".pmtiles", "")}/'
         key = filename
-        upload_local_resource_to_s3(directory, filename, bucket, key, region, endpoint)
+        argument_tuples.append((directory, filename, bucket, key, region, endpoint, item['md5sum']))
+    return argument_tuples
 
-def handle_tarballs(bucket, region, endpoint):
-
-    r = requests.get('https://download.mapterhorn.com/attribution.json')
-    if r.status_code != 200:
-        raise Exception('Error: could not get online attribution.json')
-
-    online_attribution = json.loads(r.text)
-    online_source_md5sums = {}
-    for item in online_attribution:
-        online_source_md5sums[item['source']] = item['tarball_md5sum']
+def get_tarball_argument_tuples(online_attribution, bucket, region, endpoint):
+    online_source_md5sums = {item['source']: item['tarball_md5sum'] for item in online_attribution}
 
     attribution = None
     with open('bundle-store/attribution.json') as f:
         attribution = json.load(f)
     
+    argument_tuples = []
     for item in attribution:
         print(item['source'])
         if item['source'] != 'at1' and item['source'] in online_source_md5sums and online_source_md5sums[item['source']] == item['tarball_md5sum']:
@@ -67,7 +101,20 @@ def handle_tarballs(bucket, region, endpoint):
         filename = f'{item["source"]}.tar'
         directory = 'tar-store/'
         key = f'sources/{filename}'
-        upload_local_resource_to_s3(directory, filename, bucket, key, region, endpoint)
+        # at1 is always re-uploaded, so it also bypasses the bucket checksum check
+        md5sum = None if item['source'] == 'at1' else item['tarball_md5sum']
+        argument_tuples.append((directory, filename, bucket, key, region, endpoint, md5sum))
+    return argument_tuples
+
+def handle_pmtiles_and_tarballs(bucket, region, endpoint):
+    with ThreadPool(2) as pool:
+        online_download_urls, online_attribution = pool.map(get_online_json, ['download_urls.json', 'attribution.json'])
+
+    argument_tuples = get_pmtiles_argument_tuples(online_download_urls, bucket, region, endpoint)
+    argument_tuples += get_tarball_argument_tuples(online_attribution, bucket, region, endpoint)
+
+    with ThreadPool(PROCESSES) as pool:
+        pool.starmap(upload_local_resource_to_s3, argument_tuples, chunksize=1)
     
 if __name__ == '__main__':
 
@@ -76,9 +123,7 @@ if __name__ == '__main__':
     endpoint = 'https://5521f1c60beed398e82b05eabc341142.r2.cloudflarestorage.com/'
     
 
-    handle_pmtiles(bucket, region, endpoint)
-
-    handle_tarballs(bucket, region, endpoint)
+    handle_pmtiles_and_tarballs(bucket, region, endpoint)
     exit()
     directory = 'bundle-store/'
 
@@ -1,7 +1,6 @@
 import subprocess
 from pathlib import Path
 from glob import glob
-import math
 import os
 import hashlib
 
@@ -17,6 +16,9 @@ macrotile_z = 12
 macrotile_buffer_3857 = 150
 num_overviews = 6
 
+# creation options shared by every step that writes a source cog
+source_cog_options = '-of COG -co BLOCKSIZE=512 -co OVERVIEWS=NONE -co SPARSE_OK=YES -co BIGTIFF=YES -co COMPRESS=LERC -co MAX_Z_ERROR=0.001'
+
 X_MIN_3857, _, X_MAX_3857, __ = transform_bounds('EPSG:4326', 'EPSG:3857', -180, 0, 180, 0)
 
 def run_command(command, silent=True):
@@ -66,12 +68,6 @@ def save_terrarium_tile(data, filepath):
 def create_archive(tmp_folder, out_filepath):
     with open(out_filepath, 'wb') as f1:
         writer = Writer(f1)
-        min_z = math.inf
-        max_z = 0
-        min_lon = math.inf
-        min_lat = math.inf
-        max_lon = -math.inf
-        max_lat = -math.inf
 
         tile_ids = []
         for filepath in glob(f'{tmp_folder}/*.webp'):
@@ -80,19 +76,22 @@ def create_archive(tmp_folder, out_filepath):
             tile_ids.append(zxy_to_tileid(z=z, x=x, y=y))
         tile_ids = sorted(tile_ids)
 
+        zooms = []
+        tile_bounds = []
         for tile_id in tile_ids:
             z, x, y = tileid_to_zxy(tile_id)
             filepath = f'{tmp_folder}/{z}-{x}-{y}.webp'
             with open(filepath, 'rb') as f2:
                 writer.write_tile(tile_id, f2.read())
+            zooms.append(z)
+            tile_bounds.append(mercantile.bounds(x, y, z))
 
-            max_z = max(max_z, z)
-            min_z = min(min_z, z)
-            west, south, east, north = mercantile.bounds(x, y, z)
-            min_lon = min(min_lon, west)
-            min_lat = min(min_lat, south)
-            max_lon = max(max_lon, east)
-            max_lat = max(max_lat, north)
+        # reduce once at the end instead of four min/max calls per tile
+        min_z = min(zooms)
+        max_z = max(zooms)
+        tile_bounds = np.array(tile_bounds, dtype=np.float64)
+        min_lon, min_lat = tile_bounds[:, :2].min(axis=0)
+        max_lon, max_lat = tile_bounds[:, 2:].max(axis=0)
 
         min_lon_e7 = int(min_lon * 1e7)
         min_lat_e7 = int(min_lat * 1e7)
@@ -121,12 +120,12 @@ def create_archive(tmp_folder, out_filepath):
 def get_aggregation_item_string(aggregation_id, filename):
     result = ''
     filepath = f'aggregation-store/{aggregation_id}/{filename}'
-    if not os.path.isfile(filepath):
+    try:
+        with open(filepath) as f:
+            result = ''.join([l.strip() for l in f.readlines()])
+    except FileNotFoundError:
         return None
     
-    with open(filepath) as f:
-        result = ''.join([l.strip() for l in f.readlines()])
-    
     return result.strip()
 
 def get_dirty_aggregation_filenames(current_aggregation_id, last_aggregation_id):
@@ -135,9 +134,13 @@ def get_dirty_aggregation_filenames(current_aggregation_id, last_aggregation_id)
     if last_aggregation_id is None:
         return [filepath.split('/')[-1] for filepath in filepaths]
 
+    last_filenames = set(os.listdir(f'aggregation-store/{last_aggregation_id}'))
     dirty_filenames = []
     for filepath in filepaths:
         filename = filepath.split('/')[-1]
+        if filename not in last_filenames:
+            dirty_filenames.append(filename)
+            continue
         current = get_aggregation_item_string(current_aggregation_id, filename)
         last = get_aggregation_item_string(last_aggregation_id, filename)
         if current != last:
@@ -1,41 +1,41 @@
-import json
+import hashlib
 import requests
-from multiprocessing import Pool
+from requests.adapters import HTTPAdapter
+from multiprocessing.pool import ThreadPool
 
-import utils
-
-SILENT=True
 PROCESSES = 32
 
-def has_expected_size(url, expected_size):
-    r = requests.head(url)
-    actual_size = int(r.headers.get('Content-Length', -1))
-    return actual_size == expected_size
-
-def has_expected_md5sum(url, expected_md5sum):
-    command = f'wget {url} -O - | md5sum'
-    out, _ = utils.run_command(command, silent=SILENT)
-    parts = out.split(' ')
-    assert len(parts) > 0
-    return parts[0] == expected_md5sum
+# shared by all worker threads so TLS connections to the CDN are reused
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=PROCESSES, pool_block=True))
 
 def has_expected_size_and_md5sum(url, expected_size, expected_md5sum):
-    if not has_expected_size(url, expected_size):
-        return False
-    if not has_expected_md5sum(url, expected_md5sum):
-        return False
-    return True
+    # identity encoding so Content-Length and the hashed bytes are those of the stored object
+    with SESSION.get(url, stream=True, headers={'Accept-Encoding': 'identity'}, timeout=(10, 60)) as r:
+        r.raise_for_status()
+        actual_size = int(r.headers.get('Content-Length', -1))
+        if actual_size != expected_size:
+            return False
+        md5 = hashlib.md5()
+        for chunk in r.iter_content(chunk_size=1024 * 1024):
+            md5.update(chunk)
+    return md5.hexdigest() == expected_md5sum
 
 def print_check(url, expected_size, expected_md5sum):
     print('working on', url)
-    if has_expected_size_and_md5sum(url, expected_size, expected_md5sum):
+    try:
+        is_good = has_expected_size_and_md5sum(url, expected_size, expected_md5sum)
+    except requests.RequestException as e:
+        print(url, 'error', e)
+        return
+    if is_good:
         print(url, 'good')
     else:
         print(url, 'bad')
 
 def main():
-    r = requests.get('https://download.mapterhorn.com/download_urls.json')
-    data = json.loads(r.text)
+    r = SESSION.get('https://download.mapterhorn.com/download_urls.json')
+    data = r.json()
     
     base_url = 'https://download.mapterhorn.com/' # Cloudflare
     # base_url = 'https://nbg1.your-objectstorage.com/mapterhorn/' # Hetzner
@@ -46,7 +46,7 @@ def main():
         url = f'{base_url}{item['name']}'
         argument_tuples.append((url, item['size'], item['md5sum']))
 
-    with Pool(PROCESSES) as pool:
+    with ThreadPool(PROCESSES) as pool:
         pool.starmap(print_check, argument_tuples, chunksize=1)
 
 if __name__ == '__main__':
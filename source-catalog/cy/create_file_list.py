@@ -1,13 +1,13 @@
 import re
 import requests
 
+FILENAME_PATTERN = re.compile(r'ETRS89_\d+_\d+\.tif(?=</A>)')
+
 def main():
     r = requests.get('https://eservices.dls.moi.gov.cy/inspire_downloads/EL/rasters/2019_DTM/')
-    pattern = r'ETRS89_\d+_\d+\.tif(?=</A>)'
-    filenames = re.findall(pattern, r.text)
+    filenames = FILENAME_PATTERN.findall(r.text)
     with open('file_list.txt', 'w') as f:
-        for filename in filenames:
-            f.write(f'https://eservices.dls.moi.gov.cy/inspire_downloads/EL/rasters/2019_DTM/{filename}\n')
+        f.writelines(f'https://eservices.dls.moi.gov.cy/inspire_downloads/EL/rasters/2019_DTM/{filename}\n' for filename in filenames)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
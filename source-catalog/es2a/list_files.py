@@ -1,42 +1,59 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+from multiprocessing.pool import ThreadPool
+
+PROCESSES = 16
+
+# one keep-alive connection per thread, the listing queries are safe to retry
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=PROCESSES,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=None),
+))
+
+FILE_PATTERN = re.compile(rb'(?<=data-sec=")[^"]*')
+
+URL = 'https://centrodedescargas.cnig.es/CentroDescargas/archivosSerie'
+
+# form fields shared by every page request, only numPagina changes
+DATA = {
+    'codAgr': 'MOMDT',
+    'codSerie': 'MDT02',
+    'coordenadas': '',
+    'codComAutonoma': '',
+    'codProvincia': '',
+    'codIne': '',
+    'codTipoArchivo': '',
+    'todaEspania': '',
+    'todoMundo': '',
+    'idProductor': '',
+    'rutaNombre': '',
+    'numHoja': '',
+    'numHoja25': '',
+    'totalArchivos': '8306',
+    'keySearch': '',
+    'referCatastral': '',
+    'orderBy': '',
+}
 
 def process_page(page):
-    url = 'https://centrodedescargas.cnig.es/CentroDescargas/archivosSerie'
-
-    data = {
-        'numPagina': f'{page}',
-        'codAgr': 'MOMDT',
-        'codSerie': 'MDT02',
-        'coordenadas': '',
-        'codComAutonoma': '',
-        'codProvincia': '',
-        'codIne': '',
-        'codTipoArchivo': '',
-        'todaEspania': '',
-        'todoMundo': '',
-        'idProductor': '',
-        'rutaNombre': '',
-        'numHoja': '',
-        'numHoja25': '',
-        'totalArchivos': '8306',
-        'keySearch': '',
-        'referCatastral': '',
-        'orderBy': '',
-    }
-
-    response = requests.post(
-        url,
+    data = {'numPagina': f'{page}', **DATA}
+
+    response = SESSION.post(
+        URL,
         data=data,
+        timeout=60,
     )
 
-    return re.findall(r'(?<=data-sec=")[^"]*', response.text)
+    return [file.decode() for file in FILE_PATTERN.findall(response.content)]
 
 def main():
-    for page in range(1, 417):
-        files = process_page(page)
-        for file in files:
-            print(file)
+    with ThreadPool(PROCESSES) as pool:
+        for files in pool.imap(process_page, range(1, 417)):
+            for file in files:
+                print(file)
 
 if __name__ == '__main__':
     main()
@@ -6,8 +6,7 @@ def main():
     pattern = r'https://nedlasting\.geonorge\.no/hoydedata/DTM1/[^/"]+-[^/"]+-[^/"]+\.tif'
     urls = re.findall(pattern, r.text)
     with open('file_list.txt', 'w') as f:
-        for url in urls:
-            f.write(f'{url}\n')
+        f.writelines(f'{url}\n' for url in urls)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file